@@ -17,8 +17,19 @@ class PingCapabilityImplementation(P_ngBaseCapabilityImplementation):
 
     intersect_sdk_capability_name = 'ping'
 
+    def __init__(self) -> None:
+        """Set up the event used to stop the emitting thread."""
+        super().__init__()
+        self._stop_event = threading.Event()
+
     def after_service_startup(self) -> None:
-        """Called after service startup."""
+        """Called after service startup.
+
+        The SDK's API is synchronous and the lifecycle loop owns the main thread, so we emit events from a
+        separate daemon thread rather than from an asyncio task; the thread spends nearly all of its time
+        blocked on the stop event, so it costs very little.
+        """
+        self._stop_event.clear()
         self.counter_thread = threading.Thread(
             target=self.ping_event,
             daemon=True,
@@ -29,10 +40,18 @@ class PingCapabilityImplementation(P_ngBaseCapabilityImplementation):
     @intersect_event(events={'ping': IntersectEventDefinition(event_type=str)})
     def ping_event(self) -> None:
         """Send out a ping event every 2 seconds."""
+        # schedule against a monotonic deadline, so time spent emitting the event does not cause drift
+        deadline = time.monotonic()
         while True:
-            time.sleep(2.0)
+            deadline += 2.0
+            if self._stop_event.wait(max(0.0, deadline - time.monotonic())):
+                break
             self.intersect_sdk_emit_event('ping', 'ping')
 
+    def before_service_shutdown(self) -> None:
+        """Called before service shutdown."""
+        self._stop_event.set()
+
 
 if __name__ == '__main__':
     run_service(PingCapabilityImplementation())
@@ -17,8 +17,14 @@ class PongCapabilityImplementation(P_ngBaseCapabilityImplementation):
 
     intersect_sdk_capability_name = 'pong'
 
+    def __init__(self) -> None:
+        """Set up the event used to stop the emitting thread."""
+        super().__init__()
+        self._stop_event = threading.Event()
+
     def after_service_startup(self) -> None:
         """Called after service startup."""
+        self._stop_event.clear()
         self.counter_thread = threading.Thread(
             target=self.pong_event,
             daemon=True,
@@ -29,10 +35,18 @@ class PongCapabilityImplementation(P_ngBaseCapabilityImplementation):
     @intersect_event(events={'pong': IntersectEventDefinition(event_type=str)})
     def pong_event(self) -> None:
         """Send out a pong event every 2 seconds."""
+        # schedule against a monotonic deadline, so time spent emitting the event does not cause drift
+        deadline = time.monotonic()
         while True:
-            time.sleep(2.0)
+            deadline += 2.0
+            if self._stop_event.wait(max(0.0, deadline - time.monotonic())):
+                break
             self.intersect_sdk_emit_event('pong', 'pong')
 
+    def before_service_shutdown(self) -> None:
+        """Called before service shutdown."""
+        self._stop_event.set()
+
 
 if __name__ == '__main__':
     run_service(PongCapabilityImplementation())
@@ -21,6 +21,10 @@ class P_ngBaseCapabilityImplementation(IntersectBaseCapabilityImplementation, AB
     def after_service_startup(self) -> None:
         """Common function implemented by the various P-NG capabilities after the service starts up."""
 
+    @abstractmethod
+    def before_service_shutdown(self) -> None:
+        """Common function implemented by the various P-NG capabilities before the service shuts down."""
+
 
 def run_service(capability: P_ngBaseCapabilityImplementation) -> None:
     """The idea behind the two services is that each one will emit a unique event.
@@ -56,7 +60,11 @@ def run_service(capability: P_ngBaseCapabilityImplementation) -> None:
     Here, we provide the after_service_startup function on the capability as a post startup callback.
 
     This ensures we don't emit any events until we've actually started up our Service.
+
+    We also provide the before_service_shutdown function as a cleanup callback, so the capability can stop emitting events.
     """
     default_intersect_lifecycle_loop(
-        service, post_startup_callback=capability.after_service_startup
+        service,
+        post_startup_callback=capability.after_service_startup,
+        cleanup_callback=lambda _signal: capability.before_service_shutdown(),
     )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import socket
 import threading
 import uuid
 from typing import TYPE_CHECKING, Any, Callable
@@ -181,6 +182,10 @@ class MQTTClient(BrokerClient):
         """
         # Return code 0 means connection was successful
         if rc == 0:
+            # INTERSECT messages are small and latency-sensitive, don't let Nagle's algorithm hold them back
+            sock = self._connection.socket()
+            if isinstance(sock, socket.socket):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self._connected = True
             self._connection_retries = 0
             self._should_disconnect = False
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 if TYPE_CHECKING:
     from pydantic import TypeAdapter
 
+    from ..core_definitions import IntersectDataHandler, IntersectMimeType
+
 
 class FunctionMetadata(NamedTuple):
     """Internal cache of public function metadata.
@@ -29,3 +31,19 @@ class FunctionMetadata(NamedTuple):
     """
     Type adapter for serializing and validating responses.
     """
+    response_data_handler: IntersectDataHandler
+    """
+    How responses are transferred (i.e. through the message itself, or through MINIO).
+    """
+    response_content_type: IntersectMimeType
+    """
+    How responses are serialized.
+    """
+    strict_validation: bool
+    """
+    Whether requests should be validated with Pydantic's strict mode.
+    """
+    shutdown_keys: frozenset[str]
+    """
+    Keys which will block this function from being called if the service has any of them set.
+    """
@@ -5,9 +5,11 @@ See: https://docs.pydantic.dev/latest/api/json_schema/#pydantic.json_schema.Gene
 
 from __future__ import annotations
 
+import functools
 from typing import (
     TYPE_CHECKING,
     Any,
+    Mapping,
 )
 
 from jsonschema import Draft202012Validator as SchemaValidator
@@ -77,13 +79,28 @@ def validate_schema(json_schema: Any) -> list[str]:
     Returns a list of error strings. If list is empty, there were no errors.
     """
     # custom impl. of check_schema() , gather all errors instead of throwing on first error
+    return [
+        f'{error.json_path} : {error.message}'
+        for error in _get_metavalidator().iter_errors(json_schema)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_metavalidator() -> SchemaValidator:
+    """The metaschema never changes, so build its validator once and reuse it for every schema we check."""
     validator_cls = validator_for(SchemaValidator.META_SCHEMA, default=SchemaValidator)
     metavalidator: SchemaValidator = validator_cls(
         SchemaValidator.META_SCHEMA, format_checker=SchemaValidator.FORMAT_CHECKER
     )
-    return [
-        f'{error.json_path} : {error.message}' for error in metavalidator.iter_errors(json_schema)
-    ]
+    return metavalidator
+
+
+def _declares_no_fields(schema: Mapping[str, Any]) -> bool:
+    """Check if a TypedDict, model-fields, or dataclass-args core schema has no fields to generate properties from.
+
+    This lets us reject empty classes without having Pydantic generate their JSON schema first.
+    """
+    return not schema.get('fields') and not schema.get('computed_fields')
 
 
 class GenerateTypedJsonSchema(GenerateJsonSchema):
@@ -190,7 +207,8 @@ class GenerateTypedJsonSchema(GenerateJsonSchema):
     def tuple_schema(self, schema: core_schema.TupleSchema) -> JsonSchemaValue:
         """Generates a JSON schema that matches a tuple schema e.g. `Tuple[int,str, bool]` or `Tuple[int, ...]`.
 
-        OVERRIDE: disallow bare tuple typing, Tuple[()], and tuple[()] types, otherwise defer to Pydantic's handling
+        OVERRIDE: disallow bare tuple typing, Tuple[()], and tuple[()] types, otherwise defer to Pydantic's handling.
+        Tuple[()] is rejected before Pydantic generates anything.
 
         Args:
             schema: The core schema.
@@ -198,12 +216,12 @@ class GenerateTypedJsonSchema(GenerateJsonSchema):
         Returns:
             The generated JSON schema.
         """
+        msg = 'core_schema.TupleSchema: Tuple must have non-empty types and not use () as a type for INTERSECT'
+        if not schema.get('items_schema'):
+            return self.handle_invalid_for_json_schema(schema, msg)
         json_schema = super().tuple_schema(schema)
         if not json_schema.get('items') and not json_schema.get('prefixItems'):
-            return self.handle_invalid_for_json_schema(
-                schema,
-                'core_schema.TupleSchema: Tuple must have non-empty types and not use () as a type for INTERSECT',
-            )
+            return self.handle_invalid_for_json_schema(schema, msg)
         return json_schema
 
     def set_schema(self, schema: core_schema.SetSchema) -> JsonSchemaValue:
@@ -410,7 +428,8 @@ class GenerateTypedJsonSchema(GenerateJsonSchema):
     def typed_dict_schema(self, schema: core_schema.TypedDictSchema) -> JsonSchemaValue:
         """Generates a JSON schema that matches a schema that defines a typed dict.
 
-        OVERRIDE: make sure TypedDict class has at least one property, otherwise defer to Pydantic's handling
+        OVERRIDE: make sure TypedDict class has at least one property, otherwise defer to Pydantic's handling.
+        A TypedDict without any fields is rejected before Pydantic generates anything.
 
         Args:
             schema: The core schema.
@@ -418,17 +437,19 @@ class GenerateTypedJsonSchema(GenerateJsonSchema):
         Returns:
             The generated JSON schema.
         """
+        msg = 'TypedDict (empty TypedDict not allowed in INTERSECT)'
+        if _declares_no_fields(schema):
+            return self.handle_invalid_for_json_schema(schema, msg)
         json_schema = super().typed_dict_schema(schema)
         if not json_schema.get('properties'):
-            return self.handle_invalid_for_json_schema(
-                schema, 'TypedDict (empty TypedDict not allowed in INTERSECT)'
-            )
+            return self.handle_invalid_for_json_schema(schema, msg)
         return json_schema
 
     def model_schema(self, schema: core_schema.ModelSchema) -> JsonSchemaValue:
         """Generates a JSON schema that matches a schema that defines a model.
 
-        OVERRIDE: make sure BaseModel class has at least one property, otherwise defer to Pydantic's handling
+        OVERRIDE: make sure BaseModel class has at least one property, otherwise defer to Pydantic's handling.
+        A model without any fields is rejected before Pydantic generates anything.
 
         Args:
             schema: The core schema.
@@ -436,18 +457,20 @@ class GenerateTypedJsonSchema(GenerateJsonSchema):
         Returns:
             The generated JSON schema.
         """
+        msg = f'pydantic.BaseModel "{schema["cls"].__name__}" (needs at least one property for INTERSECT)'
+        fields_schema = schema['schema']
+        if fields_schema['type'] == 'model-fields' and _declares_no_fields(fields_schema):
+            return self.handle_invalid_for_json_schema(schema, msg)
         json_schema = super().model_schema(schema)
         if not json_schema.get('properties'):
-            return self.handle_invalid_for_json_schema(
-                schema,
-                f'pydantic.BaseModel "{schema["cls"].__name__}" (needs at least one property for INTERSECT)',
-            )
+            return self.handle_invalid_for_json_schema(schema, msg)
         return json_schema
 
     def dataclass_schema(self, schema: core_schema.DataclassSchema) -> JsonSchemaValue:
         """Generates a JSON schema that matches a schema that defines a dataclass.
 
-        OVERRIDE: make sure dataclass has at least one property, otherwise defer to Pydantic's handling
+        OVERRIDE: make sure dataclass has at least one property, otherwise defer to Pydantic's handling.
+        A dataclass without any fields is rejected before Pydantic generates anything.
 
         Args:
             schema: The core schema.
@@ -455,12 +478,13 @@ class GenerateTypedJsonSchema(GenerateJsonSchema):
         Returns:
             The generated JSON schema.
         """
+        msg = f'dataclass "{schema["cls"].__name__}" (needs at least one property for INTERSECT)'
+        fields_schema = schema['schema']
+        if fields_schema['type'] == 'dataclass-args' and _declares_no_fields(fields_schema):
+            return self.handle_invalid_for_json_schema(schema, msg)
         json_schema = super().dataclass_schema(schema)
         if not json_schema.get('properties'):
-            return self.handle_invalid_for_json_schema(
-                schema,
-                f'dataclass "{schema["cls"].__name__}" (needs at least one property for INTERSECT)',
-            )
+            return self.handle_invalid_for_json_schema(schema, msg)
         return json_schema
 
     def kw_arguments_schema(
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import collections
+import collections.abc
+import copy
 import inspect
 import re
 from enum import Enum
@@ -26,6 +29,8 @@ from .constants import (
     REQUEST_CONTENT,
     RESPONSE_CONTENT,
     RESPONSE_DATA,
+    SHUTDOWN_KEYS,
+    STRICT_VALIDATION,
 )
 from .event_metadata import EventMetadata, definition_metadata_differences
 from .function_metadata import FunctionMetadata
@@ -45,6 +50,11 @@ if TYPE_CHECKING:
 
 ASYNCAPI_VERSION = '2.6.0'
 
+# The schema format should be hard-coded and determined based on how Pydantic parses the schema.
+# See https://docs.pydantic.dev/latest/concepts/json_schema/ for that specification.
+_SCHEMA_FORMAT = f'application/vnd.aai.asyncapi+json;version={ASYNCAPI_VERSION}'
+_COMMON_HEADERS_REF = '#/components/messageTraits/commonHeaders'
+
 # TypeAdapter works on a variety of types, try to document them here
 SCHEMA_HELP_MSG = """
 Valid types include any class extending from pydantic.BaseModel, dataclasses, primitives, List, Set, FrozenSet, Iterable, Dict, Mapping, Tuple, NamedTuple, TypedDict, Optional, and Union.
@@ -59,6 +69,31 @@ For a complete reference, https://docs.pydantic.dev/latest/concepts/conversion_t
 CAPABILITY_NAME_PATTERN = r'[\w-]+'
 """Regular expression we use to check valid capability names. Since capability namespacing only occurs in services, we can be more lax than for how we name services/systems/etc. """
 
+_PRIMITIVE_JSON_SCHEMAS: dict[type, dict[str, Any]] = {
+    int: {'type': 'integer'},
+    str: {'type': 'string'},
+    bool: {'type': 'boolean'},
+    float: {'type': 'number'},
+    bytes: {'format': 'binary', 'type': 'string'},
+    type(None): {'type': 'null'},
+}
+"""JSON schemas of primitive types, which are identical to what Pydantic generates, but don't require running the schema generator.
+
+An annotation of None is looked up as NoneType.
+"""
+
+_MAPPING_ORIGINS = frozenset(
+    {
+        dict,
+        collections.OrderedDict,
+        collections.defaultdict,
+        collections.Counter,
+        collections.abc.Mapping,
+        collections.abc.MutableMapping,
+    }
+)
+"""The origins typing produces for the common mapping annotations (Dict, OrderedDict, DefaultDict, Counter, Mapping, MutableMapping)."""
+
 
 class _FunctionAnalysisResult(NamedTuple):
     """private class generated from static analysis of function."""
@@ -74,6 +109,55 @@ class _FunctionAnalysisResult(NamedTuple):
     """
 
 
+class _SchemaBuildCache(NamedTuple):
+    """private class which caches work across all capabilities of a single schema build.
+
+    The same annotation (i.e. a shared request model) frequently appears across several entrypoints and capabilities,
+    and building the Pydantic core schema is the most expensive part of constructing a TypeAdapter.
+    The cache only lives as long as the schema build, so it never keeps users' classes alive.
+    """
+
+    adapters: dict[tuple[Any, str], TypeAdapter[Any]]
+    """TypeAdapters, keyed off of the annotation they were generated from"""
+    schemas: dict[tuple[Any, str, str], tuple[dict[str, Any], dict[str, Any]]]
+    """generated JSON schemas, keyed off of the annotation and the schema mode.
+
+    Values are the schema definitions the annotation adds to the "$defs", and the payload schema of the annotation itself.
+    """
+
+
+def _cache_key(annotation: Any) -> tuple[Any, str] | None:
+    """Get the key used to look up an annotation in the schema build cache, or None if the annotation should not be cached.
+
+    The repr is part of the key because typing considers some annotations equal even when Pydantic does not treat them the same
+    (i.e. Union[int, str] == Union[str, int], but the generated schemas differ in order).
+    String annotations are forward references which depend on the namespace they were declared in, so they are never cached.
+    """
+    if isinstance(annotation, str):
+        return None
+    key = (annotation, repr(annotation))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_type_adapter(annotation: Any, cache: _SchemaBuildCache) -> TypeAdapter[Any]:
+    """Get a TypeAdapter for the annotation, reusing a previously constructed TypeAdapter if possible.
+
+    Raises PydanticUserError if Pydantic can't handle the annotation; failures are never cached.
+    """
+    key = _cache_key(annotation)
+    if key is None:
+        return TypeAdapter(annotation)
+    adapter = cache.adapters.get(key)
+    if adapter is None:
+        adapter = TypeAdapter(annotation)
+        cache.adapters[key] = adapter
+    return adapter
+
+
 def _function_static_analysis(
     capability: type[IntersectBaseCapabilityImplementation],
     name: str,
@@ -119,9 +203,28 @@ def _get_functions(
     intersect_messages = []
     intersect_events = []
 
-    for name in dir(capability):
+    # walk the class dictionaries directly instead of calling getattr() on everything in dir(),
+    # which would needlessly bind every inherited attribute (and execute class-level descriptors).
+    # the annotation type of each function is determined during the walk, so each attribute is only inspected once
+    annotated_names: dict[str, str] = {}
+    seen_names: set[str] = set()
+    for klass in capability.__mro__:
+        for name, attr in klass.__dict__.items():
+            if name in seen_names:
+                continue
+            seen_names.add(name)
+            # staticmethod/classmethod objects do not expose the attributes of the function they wrap
+            func = attr.__func__ if isinstance(attr, (staticmethod, classmethod)) else attr
+            for annotation_attr in (BASE_EVENT_ATTR, BASE_RESPONSE_ATTR, BASE_STATUS_ATTR):
+                if hasattr(func, annotation_attr):
+                    annotated_names[name] = annotation_attr
+                    break
+
+    # sort the names so the generated schema is deterministic
+    for name in sorted(annotated_names):
+        annotation_attr = annotated_names[name]
         method = getattr(capability, name)
-        if hasattr(method, BASE_EVENT_ATTR):
+        if annotation_attr == BASE_EVENT_ATTR:
             intersect_events.append(
                 _function_static_analysis(
                     capability,
@@ -130,9 +233,9 @@ def _get_functions(
                     False,
                 )
             )
-        elif hasattr(method, BASE_RESPONSE_ATTR):
+        elif annotation_attr == BASE_RESPONSE_ATTR:
             intersect_messages.append(_function_static_analysis(capability, name, method))
-        elif hasattr(method, BASE_STATUS_ATTR):
+        else:
             if intersect_status is not None:
                 die(
                     f"Class '{capability.__name__}' should only have one function annotated with the @intersect_status() decorator."
@@ -150,17 +253,47 @@ def _get_functions(
     return intersect_status, intersect_messages, intersect_events
 
 
-def _merge_schema_definitions(
+def _is_labeled_object(annotation: Any) -> bool:
+    """Dict, OrderedDict, and Mapping lack a user-defined label, all other object schemas get their own definitions."""
+    ann_origin = get_origin(annotation)
+    # check the common origins first, an issubclass() check against an ABC is comparatively slow
+    return not (
+        ann_origin in _MAPPING_ORIGINS
+        or (inspect.isclass(ann_origin) and issubclass(ann_origin, Mapping))
+    )
+
+
+def _is_named_tuple(annotation: Any) -> bool:
+    """NamedTuples get their own definitions, all other array types do not."""
+    return (
+        inspect.isclass(annotation)
+        and issubclass(annotation, tuple)
+        and hasattr(annotation, '_fields')
+    )
+
+
+def _is_enum(annotation: Any) -> bool:
+    """Enum typings get their own definitions, Literals are inlined."""
+    return inspect.isclass(annotation) and issubclass(annotation, Enum)
+
+
+_OWN_DEFINITION_CHECKS: dict[str, Callable[[Any], bool]] = {
+    'object': _is_labeled_object,
+    'array': _is_named_tuple,
+}
+"""Maps the JSON schema type to the check for whether the annotation gets its own definition in the schemas dictionary."""
+
+
+def _generate_schema_definitions(
     adapter: TypeAdapter[Any],
-    schemas: dict[str, Any],
     annotation: type,
     mode: JsonSchemaMode,
-) -> dict[str, Any]:
+) -> tuple[dict[str, Any], dict[str, Any]]:
     """This contains the core logic for generating a schema from the user's type definitions.
 
-    This accomplishes two things after generating the schema:
-    1) merges new schema definitions into the main schemas dictionary (NOTE: the schemas param is mutated)
-    2) returns the value which will be represented in the channel payload
+    Returns a tuple of:
+    - the new schema definitions, which should be merged into the main schemas dictionary
+    - the value which will be represented in the channel payload
 
     NOTE: Before modifying this function, you should have EXTENSIVE knowledge on how Pydantic handles
     various types internally.
@@ -170,44 +303,58 @@ def _merge_schema_definitions(
         schema_generator=GenerateTypedJsonSchema,
         mode=mode,
     )
-    definitions = schema.pop('$defs', None)
-    if definitions:
-        schemas.update(definitions)
+    definitions: dict[str, Any] = schema.pop('$defs', None) or {}
 
     # when Pydantic generates schemas, it likes to put explicit classes into $defs
     # TypeAliasType annotations always get their own definitions
     if isinstance(annotation, TypeAliasType):
-        schemas[annotation.__name__] = schema
-        return {'$ref': f'#/components/schemas/{annotation.__name__}'}
-    schema_type = schema.get('type')
-    if schema_type == 'object':
-        # Dict, OrderedDict, and Mapping lack a user-defined label, so just return the schema
-        ann_origin = get_origin(annotation)
-        if inspect.isclass(ann_origin) and issubclass(ann_origin, Mapping):
-            return schema
-        schemas[annotation.__name__] = schema
-        return {'$ref': f'#/components/schemas/{annotation.__name__}'}
-    if schema_type == 'array':
-        # NamedTuples get their own definitions, all other array types do not
-        if (
-            inspect.isclass(annotation)
-            and issubclass(annotation, tuple)
-            and hasattr(annotation, '_fields')
-        ):
-            schemas[annotation.__name__] = schema
-            return {'$ref': f'#/components/schemas/{annotation.__name__}'}
-        return schema
-    if 'enum' in schema or 'const' in schema:
-        # Enum typings get their own definitions, Literals are inlined
-        if inspect.isclass(annotation) and issubclass(annotation, Enum):
-            schemas[annotation.__name__] = schema
-            return {'$ref': f'#/components/schemas/{annotation.__name__}'}
-        return schema
-    return schema
+        definitions[annotation.__name__] = schema
+        return definitions, {'$ref': f'#/components/schemas/{annotation.__name__}'}
+    own_definition_check = _OWN_DEFINITION_CHECKS.get(schema.get('type'))
+    if own_definition_check is None and ('enum' in schema or 'const' in schema):
+        own_definition_check = _is_enum
+    if own_definition_check is not None and own_definition_check(annotation):
+        definitions[annotation.__name__] = schema
+        return definitions, {'$ref': f'#/components/schemas/{annotation.__name__}'}
+    return definitions, schema
+
+
+def _merge_schema_definitions(
+    adapter: TypeAdapter[Any],
+    schemas: dict[str, Any],
+    annotation: type,
+    mode: JsonSchemaMode,
+    cache: _SchemaBuildCache,
+) -> dict[str, Any]:
+    """Generate the schema for the user's type definition, reusing a previously generated schema if possible.
+
+    This accomplishes two things after generating the schema:
+    1) merges new schema definitions into the main schemas dictionary (NOTE: the schemas param is mutated)
+    2) returns the value which will be represented in the channel payload
+
+    The cache always stores and hands out copies, as the generated schema is returned to users.
+    """
+    # primitives (including None, the most common return annotation) never add definitions, so skip the schema generator.
+    # (The TypeAdapter itself is still needed, the service always uses it to validate and serialize data.)
+    primitive = type(None) if annotation is None else annotation
+    if type(primitive) is type and primitive in _PRIMITIVE_JSON_SCHEMAS:
+        return _PRIMITIVE_JSON_SCHEMAS[primitive].copy()
+    annotation_key = _cache_key(annotation)
+    key = (*annotation_key, mode) if annotation_key else None
+    cached = cache.schemas.get(key) if key else None
+    if cached is None:
+        cached = _generate_schema_definitions(adapter, annotation, mode)
+        if key:
+            cache.schemas[key] = copy.deepcopy(cached)
+    else:
+        cached = copy.deepcopy(cached)
+    definitions, payload = cached
+    schemas.update(definitions)
+    return payload
 
 
 def _status_fn_schema(
-    status_info: _FunctionAnalysisResult, schemas: dict[str, Any]
+    status_info: _FunctionAnalysisResult, schemas: dict[str, Any], cache: _SchemaBuildCache
 ) -> tuple[
     str,
     Callable[[Any], Any],
@@ -236,7 +383,7 @@ def _status_fn_schema(
             f"On capability '{class_name}', capability status function '{status_fn_name}' should have a valid return annotation."
         )
     try:
-        status_adapter = TypeAdapter(status_signature.return_annotation)
+        status_adapter = _get_type_adapter(status_signature.return_annotation, cache)
         return (
             status_fn_name,
             status_fn,
@@ -245,6 +392,7 @@ def _status_fn_schema(
                 schemas,
                 status_signature.return_annotation,
                 'serialization',
+                cache,
             ),
             status_adapter,
         )
@@ -262,6 +410,7 @@ def _add_events(
     event_metadatas: dict[str, EventMetadata],
     function_events: dict[str, IntersectEventDefinition],
     excluded_data_handlers: set[IntersectDataHandler],
+    cache: _SchemaBuildCache,
 ) -> None:
     """Common logic for adding events to both the schema and the implementation/validation mapping."""
     for event_key, event_definition in function_events.items():
@@ -285,12 +434,13 @@ def _add_events(
                     f"On capability '{class_name}', function '{function_name}' should not set data_handler as {event_definition.data_handler} unless an instance is configured in IntersectConfig.data_stores ."
                 )
             try:
-                event_adapter: TypeAdapter[Any] = TypeAdapter(event_definition.event_type)
+                event_adapter = _get_type_adapter(event_definition.event_type, cache)
                 event_schemas[event_key] = _merge_schema_definitions(
                     event_adapter,
                     schemas,
                     event_definition.event_type,
                     'serialization',
+                    cache,
                 )
                 event_metadatas[event_key] = EventMetadata(
                     type=event_definition.event_type,
@@ -308,6 +458,7 @@ def _add_events(
 def _introspection_baseline(
     capability: type[IntersectBaseCapabilityImplementation],
     excluded_data_handlers: set[IntersectDataHandler],
+    cache: _SchemaBuildCache,
 ) -> tuple[
     dict[Any, Any],  # $defs for schemas (common)
     tuple[
@@ -369,27 +520,17 @@ def _introspection_baseline(
                 f"On capability '{class_name}', function '{name}' should have 'self' (unless a staticmethod) and zero or one additional parameters, and should not use keyword or variable length arguments (i.e. '*', *args, **kwargs)."
             )
 
-        # The schema format should be hard-coded and determined based on how Pydantic parses the schema.
-        # See https://docs.pydantic.dev/latest/concepts/json_schema/ for that specification.
-        channels[name] = {
-            'publish': {
-                'message': {
-                    'schemaFormat': f'application/vnd.aai.asyncapi+json;version={ASYNCAPI_VERSION}',
-                    'contentType': getattr(method, REQUEST_CONTENT).value,
-                    'traits': {'$ref': '#/components/messageTraits/commonHeaders'},
-                }
-            },
-            'subscribe': {
-                'message': {
-                    'schemaFormat': f'application/vnd.aai.asyncapi+json;version={ASYNCAPI_VERSION}',
-                    'contentType': getattr(method, RESPONSE_CONTENT).value,
-                    'traits': {'$ref': '#/components/messageTraits/commonHeaders'},
-                }
-            },
+        # build the channel messages as locals, the channel itself is only assembled once everything is validated
+        publish_message = {
+            'schemaFormat': _SCHEMA_FORMAT,
+            'contentType': getattr(method, REQUEST_CONTENT).value,
+            'traits': {'$ref': _COMMON_HEADERS_REF},
+        }
+        subscribe_message = {
+            'schemaFormat': _SCHEMA_FORMAT,
+            'contentType': getattr(method, RESPONSE_CONTENT).value,
+            'traits': {'$ref': _COMMON_HEADERS_REF},
         }
-        if docstring:
-            channels[name]['publish']['description'] = docstring
-            channels[name]['subscribe']['description'] = docstring
 
         # this block handles request params
         if len(method_params) == min_params + 1:
@@ -409,12 +550,13 @@ def _introspection_baseline(
                     f"On capability '{class_name}', parameter '{parameter.name}' should not use a default value in the function parameter (use 'typing_extensions.Annotated[TYPE, pydantic.Field(default=<DEFAULT>)]' instead - 'default_factory' is an acceptable, mutually exclusive argument to 'Field')."
                 )
             try:
-                function_cache_request_adapter = TypeAdapter(annotation)
-                channels[name]['subscribe']['message']['payload'] = _merge_schema_definitions(
+                function_cache_request_adapter = _get_type_adapter(annotation, cache)
+                subscribe_message['payload'] = _merge_schema_definitions(
                     function_cache_request_adapter,
                     schemas,
                     annotation,
                     'validation',
+                    cache,
                 )
             except PydanticUserError as e:
                 die(
@@ -430,12 +572,13 @@ def _introspection_baseline(
                 f"On capability '{class_name}', return type annotation on function '{name}' missing. {SCHEMA_HELP_MSG}"
             )
         try:
-            function_cache_response_adapter = TypeAdapter(return_annotation)
-            channels[name]['publish']['message']['payload'] = _merge_schema_definitions(
+            function_cache_response_adapter = _get_type_adapter(return_annotation, cache)
+            publish_message['payload'] = _merge_schema_definitions(
                 function_cache_response_adapter,
                 schemas,
                 return_annotation,
                 'serialization',
+                cache,
             )
         except PydanticUserError as e:
             die(
@@ -448,6 +591,10 @@ def _introspection_baseline(
             method,
             function_cache_request_adapter,
             function_cache_response_adapter,
+            getattr(method, RESPONSE_DATA),
+            getattr(method, RESPONSE_CONTENT),
+            getattr(method, STRICT_VALIDATION),
+            getattr(method, SHUTDOWN_KEYS),
         )
 
         # this block handles events associated with intersect_messages (implies command pattern)
@@ -460,8 +607,18 @@ def _introspection_baseline(
             event_metadatas,
             function_events,
             excluded_data_handlers,
+            cache,
         )
-        channels[name]['events'] = list(function_events.keys())
+        publish_channel: dict[str, Any] = {'message': publish_message}
+        subscribe_channel: dict[str, Any] = {'message': subscribe_message}
+        if docstring:
+            publish_channel['description'] = docstring
+            subscribe_channel['description'] = docstring
+        channels[name] = {
+            'publish': publish_channel,
+            'subscribe': subscribe_channel,
+            'events': list(function_events.keys()),
+        }
 
     # parse global schemas
     for class_name, name, method, _ in event_funcs:
@@ -473,10 +630,11 @@ def _introspection_baseline(
             event_metadatas,
             getattr(method, EVENT_ATTR_KEY),
             excluded_data_handlers,
+            cache,
         )
 
     status_fn_name, status_fn, status_fn_schema, status_fn_type_adapter = (
-        _status_fn_schema(status_func, schemas) if status_func else (None, None, None, None)
+        _status_fn_schema(status_func, schemas, cache) if status_func else (None, None, None, None)
     )
     # this conditional allows for the status function to also be called like a message
     if status_fn_type_adapter and status_fn and status_fn_name:
@@ -486,6 +644,10 @@ def _introspection_baseline(
             status_fn,
             None,
             status_fn_type_adapter,
+            getattr(status_fn, RESPONSE_DATA),
+            getattr(status_fn, RESPONSE_CONTENT),
+            getattr(status_fn, STRICT_VALIDATION),
+            getattr(status_fn, SHUTDOWN_KEYS),
         )
 
     return (
@@ -530,6 +692,8 @@ def get_schema_and_functions_from_capability_implementations(
         str, Any
     ] = {}  # event schemas - TODO event names are currently "global" across capabilities, may want to change this?
     event_map: dict[str, EventMetadata] = {}  # event functionality
+    # shared across capabilities, discarded once the schema is built
+    cache = _SchemaBuildCache({}, {})
     for capability_type in capabilities:
         cap_name = capability_type.intersect_sdk_capability_name
         if (
@@ -552,7 +716,7 @@ def get_schema_and_functions_from_capability_implementations(
             cap_function_map,
             cap_events,
             cap_event_map,
-        ) = _introspection_baseline(capability_type, excluded_data_handlers)
+        ) = _introspection_baseline(capability_type, excluded_data_handlers, cache)
 
         if cap_status_fn_name and cap_status_schema and cap_status_type_adapter:
             if status_function_name is not None:
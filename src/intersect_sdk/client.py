@@ -119,6 +119,7 @@ class IntersectClient:
             facility=config.facility,
             organization=config.organization,
         )
+        self._hierarchy_name = self._hierarchy.hierarchy_string('.')
 
         self._data_plane_manager = DataPlaneManager(self._hierarchy, config.data_stores)
         self._control_plane_manager = ControlPlaneManager(
@@ -247,9 +248,9 @@ class IntersectClient:
         """Handle a deserialized userspace message."""
         # ONE: HANDLE CORE COMPAT ISSUES
         # is this first branch necessary? May not be in the future
-        if self._hierarchy.hierarchy_string('.') != message['headers'][
-            'destination'
-        ] or not resolve_user_version(message):
+        if self._hierarchy_name != message['headers']['destination'] or not resolve_user_version(
+            message
+        ):
             # NOTE
             # Again, I would argue that while this may seem drastic, it's fine here.
             # A client should NEVER be getting messages not addressed to it in a normal workflow.
@@ -423,7 +424,7 @@ class IntersectClient:
 
         # THREE: SEND MESSAGE
         msg = create_userspace_message(
-            source=self._hierarchy.hierarchy_string('.'),
+            source=self._hierarchy_name,
             destination=params.destination,
             content_type=params.content_type,
             data_handler=params.data_handler,
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 from typing import List, Literal, Optional, Set
 
-from pydantic import BaseModel, ConfigDict, Field, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, StringConstraints
 from typing_extensions import Annotated
 
 from ..core_definitions import IntersectDataHandler
@@ -21,8 +21,19 @@ systems we want to be compatible with. The rules:
 - Range should be from 3-63 characters
 
 The following commit tracks several issues with MINIO: https://code.ornl.gov/intersect/additive-manufacturing/ros-intersect-adapter/-/commit/fa71b791be0ccf1a5884910b5be3b5239cf9896f
+
+NOTE: this is the reference form of the rules, and is not used for validation. HierarchyConfig validates with an equivalent
+lookahead-free pattern (_HierarchyName) plus separate length limits. One difference: re.match(HIERARCHY_REGEX, ...) accepts a
+single trailing newline (Python's $ matches before it), while HierarchyConfig rejects it. Use re.fullmatch for identical results.
 """
 
+# Shared by every hierarchy field. Equivalent to HIERARCHY_REGEX, but the 3-63 character range is checked separately
+# so that the pattern needs no lookahead, which lets Pydantic use its Rust regex engine.
+# Note that a compiled re.Pattern would force the Python engine.
+_HierarchyName = Annotated[
+    str, StringConstraints(min_length=3, max_length=63, pattern=r'^[a-z](?:-?[a-z0-9])*-?$')
+]
+
 ControlProvider = Literal['mqtt3.1.1', 'amqp0.9.1']
 """The type of broker we connect to."""
 
@@ -30,27 +41,27 @@ ControlProvider = Literal['mqtt3.1.1', 'amqp0.9.1']
 class HierarchyConfig(BaseModel):
     """Configuration for registring this service in a system-of-system architecture."""
 
-    service: Annotated[str, Field(pattern=HIERARCHY_REGEX)]
+    service: _HierarchyName
     """
     The name of this application - should be unique within an INTERSECT system
     """
 
-    subsystem: Optional[str] = Field(default=None, pattern=HIERARCHY_REGEX)  # noqa: FA100 (Pydantic uses runtime annotations)
+    subsystem: Optional[_HierarchyName] = None  # noqa: FA100 (Pydantic uses runtime annotations)
     """
     An associated subsystem / service-grouping of the system (should be unique within an INTERSECT system)
     """
 
-    system: Annotated[str, Field(pattern=HIERARCHY_REGEX)]
+    system: _HierarchyName
     """
     Name of the "system", could also be thought of as a "device" (should be unique within a facility)
     """
 
-    facility: Annotated[str, Field(pattern=HIERARCHY_REGEX)]
+    facility: _HierarchyName
     """
     Name of the facility (an ORNL institutional designation, i.e. 'neutrons') (NOT abbreviated, should be unique within an organization)
     """
 
-    organization: Annotated[str, Field(pattern=HIERARCHY_REGEX)]
+    organization: _HierarchyName
     """
     Name of the organization (i.e. 'ornl') (NOT abbreviated) (should be unique in an INTERSECT cluster)
     """
@@ -64,26 +75,19 @@ class HierarchyConfig(BaseModel):
         Returns:
           Single string, which will contain all system-of-system parts. For optional parts not configured (i.e. - no subsystem), they will be represented by a "-" character.
         """
-        if not self.subsystem:
-            return join_str.join([self.organization, self.facility, self.system, '-', self.service])
-        return join_str.join(
-            [
-                self.organization,
-                self.facility,
-                self.system,
-                self.subsystem,
-                self.service,
-            ]
-        )
-
-    # we need to use the Python regex engine instead of the Rust regex engine here, because Rust's does not support lookaheads
-    model_config = ConfigDict(regex_engine='python-re')
-
-
-@dataclass
+        subsystem = self.subsystem or '-'
+        return f'{self.organization}{join_str}{self.facility}{join_str}{self.system}{join_str}{subsystem}{join_str}{self.service}'
+
+    # pydantic config
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+
+@dataclass(frozen=True)
 class ControlPlaneConfig:
     """Configuration for interacting with a broker."""
 
+    __pydantic_config__ = ConfigDict(extra='forbid', revalidate_instances='always')
+
     protocol: ControlProvider
     """
     The protocol of the broker you'd like to use (i.e. AMQP, MQTT...)
@@ -124,10 +128,12 @@ class ControlPlaneConfig:
     """
 
 
-@dataclass
+@dataclass(frozen=True)
 class DataStoreConfig:
     """Configuration for interacting with a data store."""
 
+    __pydantic_config__ = ConfigDict(extra='forbid', revalidate_instances='always')
+
     username: Annotated[str, Field(min_length=1)]
     """
     Username credentials for data store connection.
@@ -149,10 +155,12 @@ class DataStoreConfig:
     """
 
 
-@dataclass
+@dataclass(frozen=True)
 class DataStoreConfigMap:
     """Configurations for any data stores the application should talk to."""
 
+    __pydantic_config__ = ConfigDict(extra='forbid', revalidate_instances='always')
+
     minio: List[DataStoreConfig] = field(default_factory=list)  # noqa: FA100 (Pydantic uses runtime annotations)
     """
     minio configurations
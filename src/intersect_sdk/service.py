@@ -26,12 +26,6 @@ from pydantic import ConfigDict, ValidationError, validate_call
 from pydantic_core import PydanticSerializationError
 from typing_extensions import Self, final
 
-from ._internal.constants import (
-    RESPONSE_CONTENT,
-    RESPONSE_DATA,
-    SHUTDOWN_KEYS,
-    STRICT_VALIDATION,
-)
 from ._internal.control_plane.control_plane_manager import (
     GENERIC_MESSAGE_SERIALIZER,
     ControlPlaneManager,
@@ -234,7 +228,8 @@ class IntersectService(IntersectEventObserver):
         """
 
         self._hierarchy = config.hierarchy
-        self._uuid = uuid3(uuid1(), config.hierarchy.hierarchy_string('.'))
+        self._hierarchy_name = config.hierarchy.hierarchy_string('.')
+        self._uuid = uuid3(uuid1(), self._hierarchy_name)
 
         self._status_thread: StoppableThread | None = None
         self._status_ticker_interval = config.status_interval
@@ -464,9 +459,7 @@ class IntersectService(IntersectEventObserver):
         Note that this does NOT disconnect from INTERSECT, and will not block functions which
         have no markings.
         """
-        self._function_keys = set.union(
-            *(getattr(m, SHUTDOWN_KEYS) for m in (f.method for f in self._function_map.values()))
-        )
+        self._function_keys = set().union(*(f.shutdown_keys for f in self._function_map.values()))
         self._send_lifecycle_message(
             lifecycle_type=LifecycleType.FUNCTIONS_BLOCKED,
             payload=tuple(self._function_keys),
@@ -646,7 +639,7 @@ class IntersectService(IntersectEventObserver):
         """
         # ONE: HANDLE CORE COMPAT ISSUES
         # is this first branch necessary? May not be in the future
-        if self._hierarchy.hierarchy_string('.') != message['headers']['destination']:
+        if self._hierarchy_name != message['headers']['destination']:
             return None
         if not resolve_user_version(message):
             return self._make_error_message(
@@ -661,7 +654,7 @@ class IntersectService(IntersectEventObserver):
             err_msg = f'Tried to call non-existent operation {operation}'
             logger.warning(err_msg)
             return self._make_error_message(err_msg, message)
-        if self._function_keys & getattr(operation_meta.method, SHUTDOWN_KEYS):
+        if self._function_keys & operation_meta.shutdown_keys:
             err_msg = f"Function '{operation}' is currently not available for use."
             logger.error(err_msg)
             return self._make_error_message(err_msg, message)
@@ -687,10 +680,8 @@ class IntersectService(IntersectEventObserver):
                 target_capability, operation_method, operation_meta, request_params
             )
             # FIVE: SEND DATA TO APPROPRIATE DATA STORE
-            response_data_handler = getattr(operation_meta.method, RESPONSE_DATA)
-            response_content_type = getattr(operation_meta.method, RESPONSE_CONTENT)
             response_payload = self._data_plane_manager.outgoing_message_data_handler(
-                response, response_content_type, response_data_handler
+                response, operation_meta.response_content_type, operation_meta.response_data_handler
             )
         except ValidationError as e:
             # client issue with request parameters
@@ -708,8 +699,8 @@ class IntersectService(IntersectEventObserver):
         return create_userspace_message(
             source=message['headers']['destination'],
             destination=message['headers']['source'],
-            content_type=response_content_type,
-            data_handler=response_data_handler,
+            content_type=operation_meta.response_content_type,
+            data_handler=operation_meta.response_data_handler,
             operation_id=message['operationId'],
             payload=response_payload,
             message_id=message['messageId'],  # associate response with request
@@ -787,7 +778,7 @@ class IntersectService(IntersectEventObserver):
 
         # THREE: SEND MESSAGE
         msg = create_userspace_message(
-            source=self._hierarchy.hierarchy_string('.'),
+            source=self._hierarchy_name,
             destination=params.destination,
             content_type=params.content_type,
             data_handler=params.data_handler,
@@ -851,7 +842,7 @@ class IntersectService(IntersectEventObserver):
                 else:
                     request_obj = fn_meta.request_adapter.validate_json(
                         fn_params,
-                        strict=getattr(fn_meta.method, STRICT_VALIDATION),
+                        strict=fn_meta.strict_validation,
                     )
             except ValidationError as e:
                 err_msg = f'Bad arguments to application:\n{e}\n'
@@ -916,7 +907,7 @@ class IntersectService(IntersectEventObserver):
             return
 
         msg = create_event_message(
-            source=self._hierarchy.hierarchy_string('.'),
+            source=self._hierarchy_name,
             operation_id=operation,
             content_type=event_meta.content_type,
             data_handler=event_meta.data_transfer_handler,
@@ -951,7 +942,7 @@ class IntersectService(IntersectEventObserver):
     def _send_lifecycle_message(self, lifecycle_type: LifecycleType, payload: Any = None) -> None:
         """Send out a lifecycle message."""
         msg = create_lifecycle_message(
-            source=self._hierarchy.hierarchy_string('.'),
+            source=self._hierarchy_name,
             destination=self._lifecycle_channel_name,
             lifecycle_type=lifecycle_type,
             payload=payload,
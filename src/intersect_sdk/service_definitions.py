@@ -32,6 +32,9 @@ from ._internal.constants import (
 )
 from .core_definitions import IntersectDataHandler, IntersectMimeType
 
+# shutdown keys are never mutated after decoration, so every function without any can share this
+_NO_SHUTDOWN_KEYS: frozenset[str] = frozenset()
+
 
 @final
 class IntersectEventDefinition(BaseModel):
@@ -74,6 +77,30 @@ class IntersectEventDefinition(BaseModel):
     model_config = ConfigDict(revalidate_instances='always', frozen=True)
 
 
+def _mark_function(
+    func: Callable[..., Any], *, decorator_name: str, metadata: dict[str, Any]
+) -> Callable[..., Any]:
+    """Attach the metadata of an @intersect_message() or @intersect_status() decorator to the function.
+
+    This is shared by every function the decorator is applied to, so the decorators don't need to define a new closure.
+    """
+    if isinstance(func, classmethod):
+        msg = f'The `@classmethod` decorator cannot be used with `@{decorator_name}()`'
+        raise TypeError(msg)
+    if isinstance(func, staticmethod):
+        msg = f'The `@staticmethod` decorator should be applied after `@{decorator_name}` (put `@staticmethod` on top)'
+        raise TypeError(msg)
+    # the metadata is stored on the function itself, so decorating it again would overwrite the first decorator's metadata
+    if hasattr(func, BASE_RESPONSE_ATTR) or hasattr(func, BASE_STATUS_ATTR):
+        msg = f'`@{decorator_name}()` cannot be applied to a function which already has an INTERSECT annotation (define a separate function instead)'
+        raise TypeError(msg)
+
+    # attach metadata directly to the function, wrapping it would add an extra call frame to every request
+    for attr, value in metadata.items():
+        setattr(func, attr, value)
+    return func
+
+
 @validate_call
 def intersect_message(
     __func: Callable[..., Any] | None = None,
@@ -142,32 +169,23 @@ def intersect_message(
         See https://docs.pydantic.dev/latest/concepts/conversion_table/ for more info about this.
         NOTE: If you are using a Mapping type (i.e. Dict) with integer or float keys, you MUST leave this on False.
     """
-
-    def inner_decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        if isinstance(func, classmethod):
-            msg = 'The `@classmethod` decorator cannot be used with `@intersect_message()`'
-            raise TypeError(msg)
-        if isinstance(func, staticmethod):
-            msg = 'The `@staticmethod` decorator should be applied after `@intersect_message` (put `@staticmethod` on top)'
-            raise TypeError(msg)
-
-        @functools.wraps(func)
-        def __intersect_sdk_wrapper(*args: Any, **kwargs: Any) -> Any:
-            return func(*args, **kwargs)
-
-        setattr(__intersect_sdk_wrapper, BASE_RESPONSE_ATTR, True)
-        setattr(__intersect_sdk_wrapper, REQUEST_CONTENT, request_content_type)
-        setattr(__intersect_sdk_wrapper, RESPONSE_CONTENT, response_content_type)
-        setattr(__intersect_sdk_wrapper, RESPONSE_DATA, response_data_transfer_handler)
-        setattr(__intersect_sdk_wrapper, STRICT_VALIDATION, strict_request_validation)
-        setattr(__intersect_sdk_wrapper, SHUTDOWN_KEYS, set(ignore_keys) if ignore_keys else set())
-        setattr(__intersect_sdk_wrapper, EVENT_ATTR_KEY, events or {})
-
-        return __intersect_sdk_wrapper
+    decorator = functools.partial(
+        _mark_function,
+        decorator_name='intersect_message',
+        metadata={
+            BASE_RESPONSE_ATTR: True,
+            REQUEST_CONTENT: request_content_type,
+            RESPONSE_CONTENT: response_content_type,
+            RESPONSE_DATA: response_data_transfer_handler,
+            STRICT_VALIDATION: strict_request_validation,
+            SHUTDOWN_KEYS: frozenset(ignore_keys) if ignore_keys else _NO_SHUTDOWN_KEYS,
+            EVENT_ATTR_KEY: events or {},
+        },
+    )
 
     if __func:
-        return inner_decorator(__func)
-    return inner_decorator
+        return decorator(__func)
+    return decorator
 
 
 # TODO - consider forcing intersect_status endpoints to send Messages and JSON responses.
@@ -193,31 +211,22 @@ def intersect_status(
         - response_data_transfer_handler: are responses going out through the message, or through another mean
           (i.e. MINIO)?
     """
-
-    def inner_decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        if isinstance(func, classmethod):
-            msg = 'The `@classmethod` decorator cannot be used with `@intersect_status()`'
-            raise TypeError(msg)
-        if isinstance(func, staticmethod):
-            msg = 'The `@staticmethod` decorator should be applied after `@intersect_status` (put `@staticmethod` on top)'
-            raise TypeError(msg)
-
-        @functools.wraps(func)
-        def __intersect_sdk_wrapper(*args: Any, **kwargs: Any) -> Any:
-            return func(*args, **kwargs)
-
-        setattr(__intersect_sdk_wrapper, BASE_STATUS_ATTR, True)
-        setattr(__intersect_sdk_wrapper, REQUEST_CONTENT, IntersectMimeType.JSON)
-        setattr(__intersect_sdk_wrapper, RESPONSE_CONTENT, response_content_type)
-        setattr(__intersect_sdk_wrapper, RESPONSE_DATA, response_data_transfer_handler)
-        setattr(__intersect_sdk_wrapper, STRICT_VALIDATION, False)
-        setattr(__intersect_sdk_wrapper, SHUTDOWN_KEYS, set())
-
-        return __intersect_sdk_wrapper
+    decorator = functools.partial(
+        _mark_function,
+        decorator_name='intersect_status',
+        metadata={
+            BASE_STATUS_ATTR: True,
+            REQUEST_CONTENT: IntersectMimeType.JSON,
+            RESPONSE_CONTENT: response_content_type,
+            RESPONSE_DATA: response_data_transfer_handler,
+            STRICT_VALIDATION: False,
+            SHUTDOWN_KEYS: _NO_SHUTDOWN_KEYS,
+        },
+    )
 
     if __func:
-        return inner_decorator(__func)
-    return inner_decorator
+        return decorator(__func)
+    return decorator
 
 
 @validate_call
@@ -249,14 +258,11 @@ def intersect_event(
 
     def inner_decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         # NOTE: we don't actually care how users decorate their @intersect_event functions, because we don't call them.
+        # staticmethod/classmethod objects don't forward attributes, so mark the function they wrap instead.
+        target = func.__func__ if isinstance(func, (staticmethod, classmethod)) else func
+        setattr(target, BASE_EVENT_ATTR, True)
+        setattr(target, EVENT_ATTR_KEY, events)
 
-        @functools.wraps(func)
-        def __intersect_sdk_wrapper(*args: Any, **kwargs: Any) -> Any:
-            return func(*args, **kwargs)
-
-        setattr(__intersect_sdk_wrapper, BASE_EVENT_ATTR, True)
-        setattr(__intersect_sdk_wrapper, EVENT_ATTR_KEY, events)
-
-        return __intersect_sdk_wrapper
+        return func
 
     return inner_decorator
@@ -1,11 +1,14 @@
 import pytest
 from intersect_sdk import (
+    HierarchyConfig,
     IntersectBaseCapabilityImplementation,
     IntersectEventDefinition,
+    get_schema_from_capability_implementations,
     intersect_event,
     intersect_message,
     intersect_status,
 )
+from intersect_sdk._internal.constants import SHUTDOWN_KEYS, STRICT_VALIDATION
 from pydantic import ValidationError
 
 
@@ -161,3 +164,80 @@ def test_staticmethod_invalids():
             def bad_annotations(param: bool) -> bool: ...
 
     assert 'The `@staticmethod` decorator should be applied after `@intersect_status`' in str(ex2)
+
+
+def test_decorators_do_not_wrap():
+    def message_fn(self, param: bool) -> bool: ...
+
+    def status_fn(self) -> bool: ...
+
+    def event_fn(self) -> None: ...
+
+    assert intersect_message()(message_fn) is message_fn
+    assert intersect_status()(status_fn) is status_fn
+    assert (
+        intersect_event(events={'one': IntersectEventDefinition(event_type=int)})(event_fn)
+        is event_fn
+    )
+
+
+def test_function_cannot_be_decorated_twice():
+    def shared(self, param: bool) -> bool: ...
+
+    intersect_message(strict_request_validation=True, ignore_keys={'k'})(shared)
+
+    with pytest.raises(TypeError) as ex:
+        intersect_message()(shared)
+    assert '`@intersect_message()` cannot be applied to a function which already has' in str(ex)
+
+    with pytest.raises(TypeError) as ex2:
+        intersect_status()(shared)
+    assert '`@intersect_status()` cannot be applied to a function which already has' in str(ex2)
+
+    # the first decorator's metadata is left untouched
+    assert getattr(shared, STRICT_VALIDATION) is True
+    assert getattr(shared, SHUTDOWN_KEYS) == frozenset({'k'})
+
+
+def test_shutdown_keys_are_immutable():
+    @intersect_message(ignore_keys={'one', 'two'})
+    def blockable(self, param: bool) -> bool: ...
+
+    @intersect_message()
+    def unblockable(self, param: bool) -> bool: ...
+
+    @intersect_status()
+    def status(self) -> bool: ...
+
+    assert isinstance(getattr(blockable, SHUTDOWN_KEYS), frozenset)
+    assert getattr(blockable, SHUTDOWN_KEYS) == frozenset({'one', 'two'})
+    assert isinstance(getattr(unblockable, SHUTDOWN_KEYS), frozenset)
+    assert getattr(unblockable, SHUTDOWN_KEYS) == frozenset()
+    assert getattr(unblockable, SHUTDOWN_KEYS) is getattr(status, SHUTDOWN_KEYS)
+
+
+def test_event_decorator_order_does_not_matter():
+    class StackedEvents(IntersectBaseCapabilityImplementation):
+        intersect_sdk_capability_name = 'stacked'
+
+        @intersect_event(events={'static_above': IntersectEventDefinition(event_type=int)})
+        @staticmethod
+        def static_above() -> None: ...
+
+        @staticmethod
+        @intersect_event(events={'static_below': IntersectEventDefinition(event_type=int)})
+        def static_below() -> None: ...
+
+        @intersect_event(events={'class_above': IntersectEventDefinition(event_type=int)})
+        @classmethod
+        def class_above(cls) -> None: ...
+
+        @classmethod
+        @intersect_event(events={'class_below': IntersectEventDefinition(event_type=int)})
+        def class_below(cls) -> None: ...
+
+    schema = get_schema_from_capability_implementations(
+        [StackedEvents],
+        HierarchyConfig(organization='org', facility='fac', system='sys', service='serv'),
+    )
+    assert set(schema['events']) == {'static_above', 'static_below', 'class_above', 'class_below'}
@@ -1,3 +1,6 @@
+import dataclasses
+import re
+
 import pytest
 from intersect_sdk import (
     ControlPlaneConfig,
@@ -8,6 +11,7 @@ from intersect_sdk import (
     IntersectClientConfig,
     IntersectServiceConfig,
 )
+from intersect_sdk.config import HIERARCHY_REGEX
 from pydantic import TypeAdapter, ValidationError
 
 # TESTS #####################
@@ -35,15 +39,42 @@ def test_invalid_hierarchy():
             subsystem='no/slashes',
             service='a',
         )
-    errors = ex.value.errors()
+    errors = [{'type': e['type'], 'loc': e['loc']} for e in ex.value.errors()]
     assert len(errors) == 5
-    assert all(e['type'] == 'string_pattern_mismatch' for e in errors)
-    locations = [e['loc'] for e in errors]
-    assert ('organization',) in locations
-    assert ('facility',) in locations
-    assert ('system',) in locations
-    assert ('subsystem',) in locations
-    assert ('service',) in locations
+    assert {'type': 'string_pattern_mismatch', 'loc': ('organization',)} in errors
+    assert {'type': 'string_pattern_mismatch', 'loc': ('facility',)} in errors
+    assert {'type': 'string_too_short', 'loc': ('system',)} in errors
+    assert {'type': 'string_pattern_mismatch', 'loc': ('subsystem',)} in errors
+    assert {'type': 'string_too_short', 'loc': ('service',)} in errors
+
+
+def test_hierarchy_matches_regex():
+    pattern = re.compile(HIERARCHY_REGEX)
+    for value in (
+        'abc',
+        'ab-',
+        'a-b',
+        'a-b-c',
+        'a--b',
+        'ab--',
+        '-ab',
+        '1ab',
+        'Abc',
+        'ab',
+        'a' * 63,
+        'a' * 64,
+        'a' + '-a' * 31,
+        'a' * 62 + '-',
+        'abc\n',
+    ):
+        try:
+            HierarchyConfig(
+                organization=value, facility=value, system=value, subsystem=value, service=value
+            )
+            valid = True
+        except ValidationError:
+            valid = False
+        assert valid == bool(pattern.fullmatch(value)), value
 
 
 # NOTE: with dataclasses, need to validate dictionaries instead of the dataclass directly
@@ -188,6 +219,30 @@ def test_valid_service_config():
     )
     assert config.hierarchy.subsystem is None
     assert config.hierarchy.hierarchy_string('/') == 'org/this-works/ello-14/-/serv'
+    assert config.hierarchy.hierarchy_string() == 'orgthis-worksello-14-serv'
+    with_subsystem = config.hierarchy.model_copy(update={'subsystem': 'sub'})
+    assert with_subsystem.hierarchy_string('.') == 'org.this-works.ello-14.sub.serv'
     # make sure string values can be coerced into integers when specified
     assert all(isinstance(b.port, int) for b in config.brokers)
     assert all(isinstance(d.port, int) for d in config.data_stores.minio)
+
+
+def test_config_rejects_extra_fields_and_mutation():
+    with pytest.raises(ValidationError) as ex:
+        HierarchyConfig(
+            organization='org', facility='fac', system='sys', service='serv', sevrice='typo'
+        )
+    assert [e['type'] for e in ex.value.errors()] == ['extra_forbidden']
+
+    with pytest.raises(ValidationError) as ex:
+        TypeAdapter(ControlPlaneConfig).validate_python(
+            {'username': 'user', 'password': 'pass', 'protocol': 'mqtt3.1.1', 'prot': 1883}
+        )
+    assert [e['type'] for e in ex.value.errors()] == ['unexpected_keyword_argument']
+
+    hierarchy = HierarchyConfig(organization='org', facility='fac', system='sys', service='serv')
+    with pytest.raises(ValidationError):
+        hierarchy.service = 'other'
+    broker = ControlPlaneConfig(username='user', password='pass', protocol='mqtt3.1.1')
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        broker.port = 1883
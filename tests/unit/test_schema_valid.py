@@ -1,15 +1,27 @@
 import json
 from pathlib import Path
 
-from intersect_sdk import IntersectDataHandler, IntersectMimeType
+from intersect_sdk import (
+    IntersectBaseCapabilityImplementation,
+    IntersectDataHandler,
+    IntersectMimeType,
+    intersect_message,
+)
 from intersect_sdk._internal.constants import (
     REQUEST_CONTENT,
     RESPONSE_CONTENT,
     RESPONSE_DATA,
     STRICT_VALIDATION,
 )
-from intersect_sdk._internal.schema import get_schema_and_functions_from_capability_implementations
+from intersect_sdk._internal.schema import (
+    _PRIMITIVE_JSON_SCHEMAS,
+    _generate_schema_definitions,
+    _merge_schema_definitions,
+    _SchemaBuildCache,
+    get_schema_and_functions_from_capability_implementations,
+)
 from intersect_sdk.schema import get_schema_from_capability_implementations
+from pydantic import BaseModel, TypeAdapter
 
 from tests.fixtures.example_schema import (
     FAKE_HIERARCHY_CONFIG,
@@ -89,3 +101,89 @@ def test_verify_attributes():
         getattr(function_map['DummyCapability.calculate_weird_algorithm'].method, STRICT_VALIDATION)
         is True
     )
+
+    # dispatch reads the same values from the function metadata
+    for metadata in function_map.values():
+        assert metadata.response_data_handler == getattr(metadata.method, RESPONSE_DATA)
+        assert metadata.response_content_type == getattr(metadata.method, RESPONSE_CONTENT)
+        assert metadata.strict_validation == getattr(metadata.method, STRICT_VALIDATION)
+        assert isinstance(metadata.shutdown_keys, frozenset)
+
+
+def test_type_adapters_are_reused_within_a_schema_build():
+    class SharedModel(BaseModel):
+        one: int
+
+    class FirstCapability(IntersectBaseCapabilityImplementation):
+        intersect_sdk_capability_name = 'first'
+
+        @intersect_message()
+        def first_message(self, param: SharedModel) -> SharedModel: ...
+
+    class SecondCapability(IntersectBaseCapabilityImplementation):
+        intersect_sdk_capability_name = 'second'
+
+        @intersect_message()
+        def second_message(self, param: SharedModel) -> SharedModel: ...
+
+    _, function_map, _, _, _, _ = get_schema_and_functions_from_capability_implementations(
+        [FirstCapability, SecondCapability], FAKE_HIERARCHY_CONFIG, set()
+    )
+    first = function_map['first.first_message']
+    second = function_map['second.second_message']
+    assert first.request_adapter is second.request_adapter
+    assert first.response_adapter is second.response_adapter
+
+    # the cache does not outlive the schema build
+    _, other_map, _, _, _, _ = get_schema_and_functions_from_capability_implementations(
+        [FirstCapability], FAKE_HIERARCHY_CONFIG, set()
+    )
+    assert other_map['first.first_message'].request_adapter is not first.request_adapter
+
+
+def test_cached_schemas_are_not_shared():
+    with Path.open(get_fixture_path('example_schema.json'), 'rb') as f:
+        expected_schema = json.load(f)
+    first_schema = get_schema_from_capability_implementations(
+        [DummyCapabilityImplementation],
+        FAKE_HIERARCHY_CONFIG,
+    )
+    first_schema['components']['schemas'].clear()
+    for channel in first_schema['capabilities']['DummyCapability']['channels'].values():
+        channel['publish']['message'].pop('payload', None)
+    second_schema = get_schema_from_capability_implementations(
+        [DummyCapabilityImplementation],
+        FAKE_HIERARCHY_CONFIG,
+    )
+    assert expected_schema == second_schema
+
+
+def test_class_descriptors_are_not_evaluated():
+    class ExplodingDescriptor:
+        def __get__(self, obj, objtype=None):
+            msg = 'descriptors should not be evaluated during schema generation'
+            raise RuntimeError(msg)
+
+    class CapabilityWithDescriptor(IntersectBaseCapabilityImplementation):
+        intersect_sdk_capability_name = 'descriptor'
+
+        explode = ExplodingDescriptor()
+
+        @intersect_message()
+        def some_message(self, param: int) -> int: ...
+
+    schema = get_schema_from_capability_implementations(
+        [CapabilityWithDescriptor],
+        FAKE_HIERARCHY_CONFIG,
+    )
+    assert list(schema['capabilities']['descriptor']['channels']) == ['some_message']
+
+
+def test_primitive_schemas_match_pydantic():
+    for primitive in (*_PRIMITIVE_JSON_SCHEMAS, None):
+        for mode in ('validation', 'serialization'):
+            adapter = TypeAdapter(primitive)
+            assert _generate_schema_definitions(adapter, primitive, mode) == (
+                {},
+                _merge_schema_definitions(adapter, {}, primitive, mode, _SchemaBuildCache({}, {})),
+            )